@@ -133,16 +133,29 @@ class BST(BinaryTree):
 
     @staticmethod
     def _insert(self, value, node):
+        '''
+        Walks down from node to the empty position where value belongs and
+        attaches a new leaf there.
+        If value is already in the tree, nothing changes.
+        Returns the (unchanged) root of the subtree.
+        '''
         if node is None:
-            node = Node(value)
-        else:
-            if node.value == value:
-                return node
+            return Node(value)
+        start = node
+        while True:
+            if value < node.value:
+                if node.left is None:
+                    node.left = Node(value)
+                    break
+                node = node.left
             elif node.value < value:
-                node.right = self._insert(self, value, node.right)
+                if node.right is None:
+                    node.right = Node(value)
+                    break
+                node = node.right
             else:
-                node.left = self._insert(self, value, node.left)
-        return node
+                break
+        return start
 
     def insert_list(self, xs):
         '''
@@ -180,14 +193,14 @@ class BST(BinaryTree):
         FIXME:
         Implement this function.
         '''
-        if node is None:
-            return False
-        elif value < node.value:
-            return BST._find(value, node.left)
-        elif node.value == value:
-            return True
-        else:
-            return BST._find(value, node.right)
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif node.value < value:
+                node = node.right
+            else:
+                return True
+        return False
 
     def find_smallest(self):
         '''
@@ -205,18 +218,16 @@ class BST(BinaryTree):
         called directly by the user.
         '''
         assert node is not None
-        if node.left is None:
-            return node.value
-        else:
-            return BST._find_smallest(node.left)
+        while node.left is not None:
+            node = node.left
+        return node.value
 
     @staticmethod
     def _find_largest(node):
         assert node is not None
-        if node.right is None:
-            return node.value
-        else:
-            return BST._find_largest(node.right)
+        while node.right is not None:
+            node = node.right
+        return node.value
 
     def find_largest(self):
         '''
@@ -246,27 +257,42 @@ class BST(BinaryTree):
         function.
 
         HINT:
-        Use a recursive helper function.
+        Use a helper function.
         '''
         self.root = self._remove(value, self.root)
 
     def _remove(self, value, node):
+        '''
+        Removes value from the subtree rooted at node and returns the new root
+        of the subtree.
+        A node with two children takes the value of its in-order successor,
+        and the successor (which has no left child) is unlinked instead.
+        '''
+        root = node
+        parent = None
+        while node is not None:
+            if value < node.value:
+                parent, node = node, node.left
+            elif value > node.value:
+                parent, node = node, node.right
+            else:
+                break
         if node is None:
-            return node
-        elif value < node.value:
-            node.left = self._remove(value, node.left)
-        elif value > node.value:
-            node.right = self._remove(value, node.right)
+            return root
+        if node.left is not None and node.right is not None:
+            successor_parent, successor = node, node.right
+            while successor.left is not None:
+                successor_parent, successor = successor, successor.left
+            node.value = successor.value
+            parent, node = successor_parent, successor
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            return child
+        if parent.left is node:
+            parent.left = child
         else:
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            else:
-                least = self._find_smallest(node.right)
-                node.value = least
-                node.right = self._remove(node.value, node.right)
-        return node
+            parent.right = child
+        return root
 
     def remove_list(self, xs):
         '''
@@ -183,25 +183,20 @@ class BinaryTree():
     @staticmethod
     def __len__helper(node):
         '''
-        FIXME:
-        Implement this function.
-
-        HINT:
-        The pseudocode is:
-        add 1 for the current node;
-        if a left child exists, add the result of __len__helper on the left
-        child;
-        if a right child exists, add the result of __len__helper on the right
-        child;
-        return the sum of these three steps
-        '''
-        if node is None:
-            return 0
-        leng = 1
-        if node.left:
-            leng += BinaryTree.__len__helper(node.left)
-        if node.right:
-            leng += BinaryTree.__len__helper(node.right)
+        Counts the nodes below node with an explicit stack rather than
+        recursion,
+        so that degenerate (linked-list shaped) trees don't overflow the
+        Python call stack.
+        '''
+        leng = 0
+        stack = [node] if node else []
+        while stack:
+            node = stack.pop()
+            leng += 1
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
         return leng
 
     def height(self):
@@ -222,20 +217,17 @@ class BinaryTree():
     @staticmethod
     def _height(node):
         '''
-        FIXME:
-        Implement this function.
-
-        HINT:
-        The pseudocode is:
-        if a left child exists, calculate the _height of the left child;
-        if a right child exists, calculate the _height of the right child;
-        return 1 (for the current node) plus the max of the left and right
-    _heights calculated above
-        '''
-        right = 0
-        left = 0
-        if node is None:
-            return -1
-        left = BinaryTree._height(node.left)
-        right = BinaryTree._height(node.right)
-        return 1 + max(left, right)
+        Computes the height one level at a time:
+        the height is the number of levels below node,
+        and the height of an empty tree is -1.
+        This avoids recursion so that degenerate trees are supported.
+        '''
+        height = -1
+        level = [node] if node else []
+        while level:
+            height += 1
+            level = [child
+                     for parent in level
+                     for child in (parent.left, parent.right)
+                     if child]
+        return height
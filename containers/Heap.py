@@ -11,6 +11,10 @@ This homework is using an explicit tree implementation to help you get more
 practice with OOP-style programming and classes.
 '''
 
+import heapq
+from array import array
+from collections import deque
+
 from containers.BinaryTree import BinaryTree, Node
 
 
@@ -32,7 +36,39 @@ class Heap(BinaryTree):
         self.num_nodes = 0
         self.size = 0
         if xs:
-            self.insert_list(xs)
+            self._heapify(xs)
+
+    @classmethod
+    def from_iterable(cls, xs):
+        '''
+        Builds a heap containing every element of the iterable xs in O(n)
+        time.
+        '''
+        return cls(list(xs))
+
+    def _heapify(self, xs):
+        '''
+        Replaces the contents of the heap with the elements of xs using
+        Floyd's bottom-up construction.
+        The values are first laid out in level order
+        (so the tree already has the shape of a complete heap),
+        and then every internal node is trickled down starting from the last
+        one.
+        Most nodes are near the bottom of the tree and trickle only a short
+        distance,
+        so the total work is O(n) rather than the O(n log n) of repeated
+        inserts.
+        '''
+        nodes = [Node(x) for x in xs]
+        n = len(nodes)
+        for i in range(n // 2):
+            nodes[i].left = nodes[2 * i + 1]
+            if 2 * i + 2 < n:
+                nodes[i].right = nodes[2 * i + 2]
+        for i in reversed(range(n // 2)):
+            Heap._trickle(nodes[i])
+        self.root = nodes[0] if nodes else None
+        self.num_nodes = n
 
     def __repr__(self):
         '''
@@ -141,6 +177,66 @@ class Heap(BinaryTree):
         for x in xs:
             self.insert(x)
 
+    def merge(self, other):
+        '''
+        Adds every element of the heap other into self.
+        other is not modified.
+
+        When other is large relative to self,
+        both heaps are laid out in level order and rebuilt with _heapify,
+        which is O(n + m);
+        when other is small, its elements are simply inserted one at a time,
+        which is O(m log(n + m)).
+        '''
+        xs = other._level_order()
+        total = len(xs) + self.num_nodes
+        if len(xs) * total.bit_length() < total:
+            self.insert_list(xs)
+        else:
+            self._heapify(self._level_order() + xs)
+
+    def __ior__(self, other):
+        self.merge(other)
+        return self
+
+    def _level_order(self):
+        '''
+        Returns the values of the heap in level order.
+        This is exactly the layout of the equivalent implicit (array) heap.
+        '''
+        ret = []
+        if self.root:
+            queue = deque([self.root])
+            while queue:
+                node = queue.popleft()
+                ret.append(node.value)
+                if node.left:
+                    queue.append(node.left)
+                if node.right:
+                    queue.append(node.right)
+        return ret
+
+    def iter_sorted(self):
+        '''
+        Lazily yields the values of the heap in sorted order without
+        modifying the heap.
+        A frontier of candidate nodes is kept in a small auxiliary heap:
+        the next value in sorted order is always the smallest candidate,
+        and once it is yielded its children become candidates.
+        Producing the first k values therefore costs O(k log k).
+        '''
+        if self.root is None:
+            return
+        count = 0
+        frontier = [(self.root.value, count, self.root)]
+        while frontier:
+            value, _, node = heapq.heappop(frontier)
+            yield value
+            for child in (node.left, node.right):
+                if child:
+                    count += 1
+                    heapq.heappush(frontier, (child.value, count, child))
+
     def find_smallest(self):
         '''
         Returns the smallest value in the tree.
@@ -148,9 +244,50 @@ class Heap(BinaryTree):
         FIXME:
         Implement this function.
         '''
-        if len(self.to_list('postorder')) == 0:
+        if self.root is None:
             return 'empty'
-        return min(self.to_list('postorder'))
+        return self.peek()
+
+    def peek(self):
+        '''
+        Returns the smallest value in the heap without removing it.
+        The heap property guarantees this is the root, so this is O(1).
+        '''
+        if self.root is None:
+            raise ValueError('Nothing in heap')
+        return self.root.value
+
+    def pop(self):
+        '''
+        Removes the smallest value from the heap and returns it.
+        '''
+        smallest = self.peek()
+        self.remove_min()
+        return smallest
+
+    def pushpop(self, value):
+        '''
+        Inserts value and then removes and returns the smallest value.
+        This is faster than calling insert followed by pop:
+        if value is no larger than the root it is returned immediately,
+        and otherwise it takes the root's place and is trickled down once.
+        '''
+        if self.root is None or value <= self.root.value:
+            return value
+        smallest = self.root.value
+        self.root.value = value
+        Heap._trickle(self.root)
+        return smallest
+
+    def replace(self, value):
+        '''
+        Removes and returns the smallest value, and then inserts value.
+        Unlike pushpop, the returned value may be larger than value.
+        '''
+        smallest = self.peek()
+        self.root.value = value
+        Heap._trickle(self.root)
+        return smallest
 
     def remove_min(self):
         '''
@@ -176,10 +313,13 @@ class Heap(BinaryTree):
         '''
         if self.root is None:
             return 'no min'
-        binary = bin(self.num_nodes)[3:]
-        removed = Heap._remove_bottom_right(self.root, binary)
-        self.root.value = removed
-        Heap._trickle(self.root)
+        if self.num_nodes <= 1:
+            self.root = None
+        else:
+            binary = bin(self.num_nodes)[3:]
+            removed = Heap._remove_bottom_right(self.root, binary)
+            self.root.value = removed
+            Heap._trickle(self.root)
         self.num_nodes -= 1
 
     @staticmethod
@@ -215,3 +355,441 @@ class Heap(BinaryTree):
             if node.value > node.left.value:
                 node.value, node.left.value = node.left.value, node.value
                 Heap._trickle(node.left)
+
+
+class ArrayHeap(Heap):
+    '''
+    This class implements the same interface as Heap,
+    but it stores the heap as an *implicit* tree inside a contiguous list
+    (the traditional implementation used by the book).
+    The children of the value at index i are stored at indices 2*i+1 and
+    2*i+2,
+    and its parent is stored at index (i-1)//2,
+    so inserting and removing never allocates Node objects or path strings.
+
+    If a typecode is given (for example 'q' for 64-bit ints or 'd' for
+    floats),
+    the values are stored in an array.array of that type instead of a list,
+    which uses considerably less memory for numeric keys.
+    '''
+
+    def __init__(self, xs=None, typecode=None):
+        BinaryTree.__init__(self)
+        self.typecode = typecode
+        if typecode is None:
+            self.values = []
+        else:
+            self.values = array(typecode)
+        if xs:
+            self._heapify(xs)
+
+    @classmethod
+    def from_iterable(cls, xs, typecode=None):
+        '''
+        Builds a heap containing every element of the iterable xs in O(n)
+        time.
+        '''
+        return cls(list(xs), typecode)
+
+    def _heapify(self, xs):
+        '''
+        Floyd's bottom-up construction on the implicit tree:
+        the values are copied into the array as-is,
+        and every internal index is sifted down starting from the last one.
+        '''
+        if self.typecode is None:
+            self.values = list(xs)
+        else:
+            self.values = array(self.typecode, xs)
+        for i in reversed(range(len(self.values) // 2)):
+            ArrayHeap._sift_down(self.values, i)
+
+    def __str__(self):
+        '''
+        Renders the implicit tree in the same format as Node.__str__.
+        '''
+        if not self.values:
+            return str(None)
+        return ArrayHeap._str(self.values, 0)
+
+    @staticmethod
+    def _str(values, i):
+        ret = '('
+        ret += str(values[i])
+        ret += ' - '
+        if 2 * i + 1 < len(values):
+            ret += ArrayHeap._str(values, 2 * i + 1)
+            ret += ' '
+        ret += '- '
+        if 2 * i + 2 < len(values):
+            ret += ArrayHeap._str(values, 2 * i + 2)
+            ret += ' '
+        ret += ')'
+        return ret
+
+    def __len__(self):
+        return len(self.values)
+
+    def height(self):
+        '''
+        The implicit tree is always complete,
+        so its height follows directly from the number of values.
+        '''
+        return len(self.values).bit_length() - 1
+
+    def print_tree(self, traversal_type):
+        if traversal_type not in ('preorder', 'inorder', 'postorder'):
+            raise ValueError(str(traversal_type) + 'is not supported.')
+        return ''.join(str(x) + '-' for x in self.to_list(traversal_type))
+
+    def to_list(self, traversal_type):
+        '''
+        Returns the contents of the implicit tree as a list,
+        using the same traversal types as BinaryTree.to_list.
+        '''
+        if traversal_type == 'postorder':
+            return ArrayHeap._postorder(self.values, 0, [])
+        elif traversal_type == 'inorder':
+            return ArrayHeap._inorder(self.values, 0, [])
+        elif traversal_type == 'preorder':
+            return ArrayHeap._preorder(self.values, 0, [])
+        else:
+            raise ValueError("traversal type entered is invalid")
+
+    @staticmethod
+    def _preorder(values, i, traversal):
+        if i < len(values):
+            traversal.append(values[i])
+            ArrayHeap._preorder(values, 2 * i + 1, traversal)
+            ArrayHeap._preorder(values, 2 * i + 2, traversal)
+        return traversal
+
+    @staticmethod
+    def _inorder(values, i, traversal):
+        if i < len(values):
+            ArrayHeap._inorder(values, 2 * i + 1, traversal)
+            traversal.append(values[i])
+            ArrayHeap._inorder(values, 2 * i + 2, traversal)
+        return traversal
+
+    @staticmethod
+    def _postorder(values, i, traversal):
+        if i < len(values):
+            ArrayHeap._postorder(values, 2 * i + 1, traversal)
+            ArrayHeap._postorder(values, 2 * i + 2, traversal)
+            traversal.append(values[i])
+        return traversal
+
+    def is_heap_satisfied(self):
+        '''
+        Every value must be no smaller than the value of its parent.
+        '''
+        values = self.values
+        for i in range(1, len(values)):
+            if values[(i - 1) >> 1] > values[i]:
+                return False
+        return True
+
+    def insert(self, value):
+        '''
+        Appends value to the end of the array and sifts it up towards the
+        root until the heap property is satisfied.
+        '''
+        self.values.append(value)
+        ArrayHeap._sift_up(self.values, len(self.values) - 1)
+
+    @staticmethod
+    def _sift_up(values, i):
+        '''
+        Moves the value at index i up until its parent is no larger.
+        Rather than swapping at every level,
+        parents are shifted down into the hole and the value is written once.
+        '''
+        value = values[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if values[parent] <= value:
+                break
+            values[i] = values[parent]
+            i = parent
+        values[i] = value
+
+    @staticmethod
+    def _sift_down(values, i):
+        '''
+        Moves the value at index i down until both of its children are no
+        smaller.
+        '''
+        n = len(values)
+        value = values[i]
+        child = 2 * i + 1
+        while child < n:
+            if child + 1 < n and values[child + 1] < values[child]:
+                child += 1
+            if value <= values[child]:
+                break
+            values[i] = values[child]
+            i = child
+            child = 2 * i + 1
+        values[i] = value
+
+    def merge(self, other):
+        xs = other._level_order()
+        total = len(xs) + len(self.values)
+        if len(xs) * total.bit_length() < total:
+            self.insert_list(xs)
+        else:
+            self.values.extend(xs)
+            for i in reversed(range(len(self.values) // 2)):
+                ArrayHeap._sift_down(self.values, i)
+
+    def _level_order(self):
+        return list(self.values)
+
+    def iter_sorted(self):
+        values = self.values
+        n = len(values)
+        if n == 0:
+            return
+        frontier = [(values[0], 0)]
+        while frontier:
+            value, i = heapq.heappop(frontier)
+            yield value
+            child = 2 * i + 1
+            if child < n:
+                heapq.heappush(frontier, (values[child], child))
+                if child + 1 < n:
+                    heapq.heappush(frontier, (values[child + 1], child + 1))
+
+    def find_smallest(self):
+        '''
+        Returns the smallest value in the heap.
+        '''
+        if not self.values:
+            return 'empty'
+        return self.peek()
+
+    def peek(self):
+        if not self.values:
+            raise ValueError('Nothing in heap')
+        return self.values[0]
+
+    def pop(self):
+        values = self.values
+        if not values:
+            raise ValueError('Nothing in heap')
+        last = values.pop()
+        if not values:
+            return last
+        smallest = values[0]
+        values[0] = last
+        ArrayHeap._sift_down(values, 0)
+        return smallest
+
+    def pushpop(self, value):
+        values = self.values
+        if values and values[0] < value:
+            value, values[0] = values[0], value
+            ArrayHeap._sift_down(values, 0)
+        return value
+
+    def replace(self, value):
+        smallest = self.peek()
+        self.values[0] = value
+        ArrayHeap._sift_down(self.values, 0)
+        return smallest
+
+    def remove_min(self):
+        '''
+        Removes the minimum value from the heap.
+        If the heap is empty, it does nothing.
+        '''
+        if not self.values:
+            return 'no min'
+        self.pop()
+
+
+class HeapHandle():
+    '''
+    A handle refers to one element stored in an IndexedHeap.
+    The heap keeps the handle's index up to date as the element moves,
+    so the element can be found again in O(1).
+    Once the element leaves the heap, index is set to None.
+    '''
+
+    __slots__ = ('index',)
+
+    def __init__(self, index):
+        self.index = index
+
+
+class IndexedHeap(ArrayHeap):
+    '''
+    An ArrayHeap that also supports changing or removing an element that is
+    already in the heap.
+    push returns a HeapHandle for the new element,
+    and decrease_key/update/remove use that handle to find the element's
+    position directly instead of searching for it,
+    so all of these operations are O(log n).
+    This is the interface needed by Dijkstra's and A* search.
+    '''
+
+    def __init__(self, xs=None, typecode=None):
+        self._handles = []
+        super().__init__(xs, typecode)
+
+    def _heapify(self, xs):
+        if self.typecode is None:
+            self.values = list(xs)
+        else:
+            self.values = array(self.typecode, xs)
+        self._handles = [HeapHandle(i) for i in range(len(self.values))]
+        for i in reversed(range(len(self.values) // 2)):
+            self._move_down(i)
+
+    def _move_up(self, i):
+        '''
+        Like ArrayHeap._sift_up,
+        but the handles are moved along with their values.
+        Returns the final index of the element.
+        '''
+        values = self.values
+        handles = self._handles
+        value = values[i]
+        handle = handles[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if values[parent] <= value:
+                break
+            values[i] = values[parent]
+            handles[i] = handles[parent]
+            handles[i].index = i
+            i = parent
+        values[i] = value
+        handles[i] = handle
+        handle.index = i
+        return i
+
+    def _move_down(self, i):
+        '''
+        Like ArrayHeap._sift_down,
+        but the handles are moved along with their values.
+        Returns the final index of the element.
+        '''
+        values = self.values
+        handles = self._handles
+        n = len(values)
+        value = values[i]
+        handle = handles[i]
+        child = 2 * i + 1
+        while child < n:
+            if child + 1 < n and values[child + 1] < values[child]:
+                child += 1
+            if value <= values[child]:
+                break
+            values[i] = values[child]
+            handles[i] = handles[child]
+            handles[i].index = i
+            i = child
+            child = 2 * i + 1
+        values[i] = value
+        handles[i] = handle
+        handle.index = i
+        return i
+
+    def push(self, value):
+        '''
+        Inserts value into the heap and returns a handle to it.
+        '''
+        handle = HeapHandle(len(self.values))
+        self.values.append(value)
+        self._handles.append(handle)
+        self._move_up(handle.index)
+        return handle
+
+    def insert(self, value):
+        self.push(value)
+
+    def get(self, handle):
+        '''
+        Returns the value the handle refers to.
+        '''
+        self._check(handle)
+        return self.values[handle.index]
+
+    def _check(self, handle):
+        i = handle.index
+        if i is None or i >= len(self._handles) or self._handles[i] is not handle:
+            raise ValueError('handle does not refer to an element of this heap')
+
+    def update(self, handle, value):
+        '''
+        Changes the value the handle refers to and restores the heap property.
+        The new value may be smaller or larger than the old one.
+        '''
+        self._check(handle)
+        i = handle.index
+        self.values[i] = value
+        if self._move_up(i) == i:
+            self._move_down(i)
+
+    def decrease_key(self, handle, value):
+        '''
+        Lowers the value the handle refers to.
+        Raises ValueError if value is larger than the current value.
+        '''
+        self._check(handle)
+        if self.values[handle.index] < value:
+            raise ValueError('new value is larger than the current value')
+        self.values[handle.index] = value
+        self._move_up(handle.index)
+
+    def remove(self, handle):
+        '''
+        Removes the element the handle refers to from the heap and returns
+        its value.
+        '''
+        self._check(handle)
+        i = handle.index
+        value = self.values[i]
+        last = self.values.pop()
+        last_handle = self._handles.pop()
+        handle.index = None
+        if i < len(self.values):
+            self.values[i] = last
+            self._handles[i] = last_handle
+            last_handle.index = i
+            if self._move_up(i) == i:
+                self._move_down(i)
+        return value
+
+    def pop(self):
+        if not self.values:
+            raise ValueError('Nothing in heap')
+        return self.remove(self._handles[0])
+
+    def pushpop(self, value):
+        if self.values and self.values[0] < value:
+            return self.replace(value)
+        return value
+
+    def replace(self, value):
+        smallest = self.peek()
+        self._handles[0].index = None
+        self._handles[0] = HeapHandle(0)
+        self.values[0] = value
+        self._move_down(0)
+        return smallest
+
+    def merge(self, other):
+        for x in other._level_order():
+            self.push(x)
+
+
+def heap_merge(*heaps):
+    '''
+    Lazily yields the values of all of the given heaps in sorted order.
+    The heaps are not modified,
+    and only O(k log k) work is done per heap to produce its first k values.
+    '''
+    return heapq.merge(*[heap.iter_sorted() for heap in heaps])
@@ -337,3 +337,25 @@ def test__BST_eq(xs):
     bst2 = BST(xs2)
 
     assert bst1 == bst2
+
+
+def test__BST_sorted_input():
+    '''
+    Inserting sorted keys produces a tree that is a linked list.
+    None of the operations should depend on the recursion limit.
+    '''
+    n = 5000
+    bst = BST()
+    for x in range(n):
+        bst.insert(x)
+    assert len(bst) == n
+    assert bst.height() == n - 1
+    assert bst.find_smallest() == 0
+    assert bst.find_largest() == n - 1
+    assert all(x in bst for x in range(0, n, 7))
+    assert n not in bst
+    for x in range(0, n, 2):
+        bst.remove(x)
+    assert len(bst) == n // 2
+    assert bst.find_smallest() == 1
+    assert 2 not in bst and 3 in bst
@@ -180,3 +180,315 @@ def test__Heap_remove_and_insert2(xs,ys):
         heap.remove_min()
         assert heap.is_heap_satisfied()
 
+
+################################################################################
+# ArrayHeap stores the same heap in an implicit array,
+# so it must pass the same tests as the linked Heap.
+
+from containers.Heap import ArrayHeap
+
+
+def test__ArrayHeap_super():
+    x = ArrayHeap()
+    assert isinstance(x,Heap)
+    assert isinstance(x,BinaryTree)
+
+
+@given(xs=ints)
+def test__ArrayHeap_insert(xs):
+    xs = list(xs)
+    heap = ArrayHeap()
+    for x in xs:
+        heap.insert(x)
+        assert x in heap.to_list('inorder')
+        assert heap.is_heap_satisfied()
+    assert len(heap) == len(xs)
+
+
+@given(xs=ints)
+def test__ArrayHeap___init__(xs):
+    xs = list(xs)
+    heap = ArrayHeap(xs)
+    assert heap.is_heap_satisfied()
+    assert sorted(heap.to_list('preorder')) == sorted(xs)
+
+
+@given(xs=ints)
+def test__ArrayHeap_find_smallest(xs):
+    xs = list(xs)
+    if len(xs)>0:
+        heap = ArrayHeap(xs)
+        assert min(xs) == heap.find_smallest()
+
+
+@given(xs=ints)
+def test__ArrayHeap_remove(xs):
+    xs = list(xs)
+    heap = ArrayHeap(xs)
+    while len(xs)>0:
+        x = min(xs)
+        xs.remove(x)
+        assert heap.find_smallest() == x
+        heap.remove_min()
+        assert heap.is_heap_satisfied()
+        assert sorted(heap.to_list('inorder')) == sorted(xs)
+
+
+@given(xs=ints,ys=ints)
+def test__ArrayHeap_remove_and_insert(xs,ys):
+    xs = list(xs)
+    heap = ArrayHeap(xs)
+    for y in ys:
+        heap.insert(y)
+        heap.remove_min()
+        assert heap.is_heap_satisfied()
+
+
+@given(xs=st.lists(st.integers(min_value=-2**63, max_value=2**63-1)))
+def test__ArrayHeap_typecode(xs):
+    heap = ArrayHeap(xs, typecode='q')
+    assert heap.is_heap_satisfied()
+    out = []
+    while len(heap)>0:
+        out.append(heap.find_smallest())
+        heap.remove_min()
+    assert out == sorted(xs)
+
+
+def test__ArrayHeap_matches_Heap_layout():
+    '''
+    Both representations fill the tree in the same level order,
+    so they should render identically.
+    '''
+    xs = [5, 3, 8, 1, 9, 2, 7]
+    heap = Heap(xs)
+    array_heap = ArrayHeap(xs)
+    assert str(heap) == str(array_heap)
+    assert heap.print_tree('preorder') == array_heap.print_tree('preorder')
+    assert heap.height() == array_heap.height()
+    assert len(heap) == len(array_heap)
+
+
+@given(xs=ints)
+def test__Heap_from_iterable(xs):
+    heap = Heap.from_iterable(x for x in xs)
+    assert heap.is_heap_satisfied()
+    assert sorted(heap.to_list('inorder')) == sorted(xs)
+    assert len(heap) == len(xs)
+    assert heap.height() == len(xs).bit_length() - 1
+
+
+@given(xs=ints,ys=ints)
+def test__Heap___init___then_insert(xs,ys):
+    '''
+    A heap built by heapify must have the shape that insert expects,
+    so inserting and removing afterwards has to keep working.
+    '''
+    heap = Heap(xs)
+    for y in ys:
+        heap.insert(y)
+        assert heap.is_heap_satisfied()
+    out = []
+    while len(out) < len(xs) + len(ys):
+        out.append(heap.find_smallest())
+        heap.remove_min()
+    assert out == sorted(xs + ys)
+
+
+@given(xs=ints)
+def test__ArrayHeap_from_iterable(xs):
+    heap = ArrayHeap.from_iterable(x for x in xs)
+    assert heap.is_heap_satisfied()
+    assert sorted(heap.to_list('inorder')) == sorted(xs)
+
+
+import pytest
+
+
+@pytest.mark.parametrize('cls', [Heap, ArrayHeap])
+def test__Heap_peek_pop_empty(cls):
+    heap = cls()
+    assert heap.find_smallest() == 'empty'
+    with pytest.raises(ValueError):
+        heap.peek()
+    with pytest.raises(ValueError):
+        heap.pop()
+    with pytest.raises(ValueError):
+        heap.replace(1)
+    assert heap.pushpop(1) == 1
+
+
+@pytest.mark.parametrize('cls', [Heap, ArrayHeap])
+def test__Heap_pop_last(cls):
+    heap = cls([3])
+    assert heap.pop() == 3
+    assert heap.to_list('inorder') == []
+    heap.insert(4)
+    assert heap.to_list('inorder') == [4]
+    assert heap.peek() == 4
+
+
+@given(xs=ints)
+def test__Heap_pop(xs):
+    for cls in [Heap, ArrayHeap]:
+        heap = cls(xs)
+        out = []
+        for _ in xs:
+            assert heap.peek() == heap.find_smallest()
+            out.append(heap.pop())
+            assert heap.is_heap_satisfied()
+        assert out == sorted(xs)
+
+
+@given(xs=ints,ys=ints)
+def test__Heap_pushpop(xs,ys):
+    for cls in [Heap, ArrayHeap]:
+        heap = cls(xs)
+        expected = list(xs)
+        for y in ys:
+            expected.append(y)
+            x = min(expected)
+            expected.remove(x)
+            assert heap.pushpop(y) == x
+            assert heap.is_heap_satisfied()
+        assert sorted(heap.to_list('inorder')) == sorted(expected)
+
+
+@given(xs=ints,ys=ints)
+def test__Heap_replace(xs,ys):
+    for cls in [Heap, ArrayHeap]:
+        heap = cls(xs)
+        expected = list(xs)
+        for y in ys:
+            if not expected:
+                break
+            x = min(expected)
+            expected.remove(x)
+            expected.append(y)
+            assert heap.replace(y) == x
+            assert heap.is_heap_satisfied()
+        assert sorted(heap.to_list('inorder')) == sorted(expected)
+
+
+from containers.Heap import heap_merge
+
+
+@given(xs=ints)
+def test__Heap_iter_sorted(xs):
+    for cls in [Heap, ArrayHeap]:
+        heap = cls(xs)
+        assert list(heap.iter_sorted()) == sorted(xs)
+        assert sorted(heap.to_list('inorder')) == sorted(xs)
+
+
+@given(xs=ints,ys=ints)
+def test__Heap_merge(xs,ys):
+    for cls1 in [Heap, ArrayHeap]:
+        for cls2 in [Heap, ArrayHeap]:
+            heap1 = cls1(xs)
+            heap2 = cls2(ys)
+            heap1 |= heap2
+            assert heap1.is_heap_satisfied()
+            assert list(heap1.iter_sorted()) == sorted(xs + ys)
+            assert list(heap2.iter_sorted()) == sorted(ys)
+            heap1.insert(0)
+            heap1.remove_min()
+            assert heap1.is_heap_satisfied()
+            assert len(heap1) == len(xs) + len(ys)
+
+
+@given(xss=st.lists(ints, max_size=5))
+def test__heap_merge(xss):
+    heaps = [Heap(xs) if i % 2 else ArrayHeap(xs) for i, xs in enumerate(xss)]
+    assert list(heap_merge(*heaps)) == sorted(sum(xss, []))
+
+
+from containers.Heap import IndexedHeap
+
+
+@given(xs=ints)
+def test__IndexedHeap_push_pop(xs):
+    heap = IndexedHeap()
+    handles = [heap.push(x) for x in xs]
+    for h, x in zip(handles, xs):
+        assert heap.get(h) == x
+    assert heap.is_heap_satisfied()
+    out = [heap.pop() for _ in xs]
+    assert out == sorted(xs)
+    for h in handles:
+        assert h.index is None
+
+
+@given(xs=ints, data=st.data())
+def test__IndexedHeap_decrease_key(xs, data):
+    heap = IndexedHeap()
+    handles = [heap.push(x) for x in xs]
+    expected = list(xs)
+    for i in range(len(xs)):
+        delta = data.draw(st.integers(min_value=0, max_value=100))
+        expected[i] -= delta
+        heap.decrease_key(handles[i], expected[i])
+        assert heap.is_heap_satisfied()
+        assert heap.get(handles[i]) == expected[i]
+    assert [heap.pop() for _ in xs] == sorted(expected)
+
+
+@given(xs=ints, ys=ints)
+def test__IndexedHeap_update(xs, ys):
+    heap = IndexedHeap()
+    handles = [heap.push(x) for x in xs]
+    expected = list(xs)
+    for i, y in zip(range(len(xs)), ys):
+        expected[i] = y
+        heap.update(handles[i], y)
+        assert heap.is_heap_satisfied()
+    for h, x in zip(handles, expected):
+        assert heap.get(h) == x
+    assert [heap.pop() for _ in xs] == sorted(expected)
+
+
+@given(xs=ints)
+def test__IndexedHeap_remove(xs):
+    heap = IndexedHeap()
+    handles = [heap.push(x) for x in xs]
+    expected = list(xs)
+    order = list(range(len(xs)))
+    random.shuffle(order)
+    for i in order:
+        assert heap.remove(handles[i]) == xs[i]
+        expected.remove(xs[i])
+        assert heap.is_heap_satisfied()
+        assert sorted(heap.to_list('inorder')) == sorted(expected)
+        for j, h in enumerate(handles):
+            if h.index is not None:
+                assert heap.get(h) == xs[j]
+
+
+def test__IndexedHeap_stale_handle():
+    heap = IndexedHeap([1, 2, 3])
+    handle = heap.push(0)
+    heap.remove(handle)
+    with pytest.raises(ValueError):
+        heap.remove(handle)
+    handle = heap.push(5)
+    with pytest.raises(ValueError):
+        heap.decrease_key(handle, 6)
+
+
+@given(xs=ints,ys=ints)
+def test__IndexedHeap_pushpop_replace(xs,ys):
+    heap = IndexedHeap(xs)
+    expected = list(xs)
+    for y in ys:
+        expected.append(y)
+        x = min(expected)
+        expected.remove(x)
+        assert heap.pushpop(y) == x
+        if expected:
+            x = min(expected)
+            expected.remove(x)
+            expected.append(y)
+            assert heap.replace(y) == x
+        assert heap.is_heap_satisfied()
+    heap |= Heap(ys)
+    assert list(heap.iter_sorted()) == sorted(expected + ys)